@@ -32,6 +32,12 @@ class CustomUserAdmin(UserAdmin):
         ),
     )
 
-
-
-
+    def get_queryset(self, request):
+        """
+        Loads only the columns shown in the user list, skipping e.g. the password hash.
+        Other admin views keep the full queryset.
+        """
+        qs = super().get_queryset(request)
+        if request.resolver_match.url_name.endswith("_changelist"):
+            return qs.only("id", "email", "fullname", "is_staff", "is_active")
+        return qs
@@ -1,22 +1,25 @@
-from django.contrib.auth import get_user_model
+from django.db import transaction
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
+from rest_framework.validators import UniqueValidator
+from auth_app.models import User
 
-User = get_user_model()
-
-class RegistrationSerializer(serializers.ModelSerializer):
+class RegistrationSerializer(serializers.Serializer):
     """
     Serializer for user registration.
 
     Validates matching passwords and creates a new User with an auth token.
+    Declares its fields explicitly instead of using ModelSerializer, which
+    avoids model introspection on every instantiation.
     """
+    fullname = serializers.CharField(max_length=150)
+    email = serializers.EmailField(
+        max_length=254,
+        validators=[UniqueValidator(queryset=User.objects.all(), message="user with this email already exists.")],
+    )
     password = serializers.CharField(write_only=True)
     repeated_password = serializers.CharField(write_only=True)
 
-    class Meta:
-        model = User
-        fields = ["fullname", "email", "password", "repeated_password"]
-
     def validate(self, attrs):
         """
         Checks that password and repeated_password match.
@@ -32,12 +35,15 @@ class RegistrationSerializer(serializers.ModelSerializer):
         """
         Removes repeated_password, creates the user and an auth token.
 
+        Both rows are written in one transaction, so they share a single commit.
+
         Returns:
             User instance.
         """
         validated_data.pop("repeated_password")
-        user = User.objects.create_user(**validated_data)
-        Token.objects.create(user=user)
+        with transaction.atomic():
+            user = User.objects.create_user(**validated_data)
+            Token.objects.create(user=user)
         return user
 
 class LoginSerializer(serializers.Serializer):
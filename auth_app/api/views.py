@@ -1,13 +1,26 @@
-from django.contrib.auth import authenticate
-from django.contrib.auth import get_user_model
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
 from rest_framework.permissions import IsAuthenticated
 from .serializers import RegistrationSerializer, LoginSerializer
+from auth_app.backends import EmailTokenBackend
+from auth_app.models import User
 
-User = get_user_model()
+def get_user_token(user):
+    """
+    Return the auth token of a user, creating it if it does not exist yet.
+
+    Reads the token from the reverse relation, so no query is issued when
+    the user was loaded with select_related("auth_token").
+
+    Returns:
+        Token instance.
+    """
+    try:
+        return user.auth_token
+    except Token.DoesNotExist:
+        return Token.objects.create(user=user)
 
 class RegistrationView(APIView):
     """
@@ -31,12 +44,11 @@ class RegistrationView(APIView):
         serializer = RegistrationSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-            token, _ = Token.objects.get_or_create(user=user)
             return Response({
-                "token": token.key,
+                "token": user.auth_token.key,
                 "fullname": user.fullname,
                 "email": user.email,
-                "user_id": user.id,
+                "user_id": user.pk,
             }, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -64,14 +76,15 @@ class LoginView(APIView):
         if serializer.is_valid():
             email = serializer.validated_data["email"]
             password = serializer.validated_data["password"]
-            user = authenticate(request, email=email, password=password)
+            # Call the email backend directly instead of iterating AUTHENTICATION_BACKENDS.
+            user = EmailTokenBackend().authenticate(request, email=email, password=password)
             if user is not None:
-                token, _ = Token.objects.get_or_create(user=user)
+                token = get_user_token(user)
                 return Response({
                     "token": token.key,
                     "fullname": user.fullname,
                     "email": user.email,
-                    "user_id": user.id,
+                    "user_id": token.user_id,
                 }, status=status.HTTP_200_OK)
             return Response({"detail": "Invalid credentials."}, status=status.HTTP_400_BAD_REQUEST) #hier war mal 401
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -102,12 +115,7 @@ class EmailCheckView(APIView):
         if not email:
             return Response({"detail": "Email parameter is required."}, status=status.HTTP_400_BAD_REQUEST)
 
-        try:
-            user = User.objects.get(email=email)
-            return Response({
-                "id": user.id,
-                "email": user.email,
-                "fullname": user.fullname
-            })
-        except User.DoesNotExist:
+        user_data = User.objects.values("id", "email", "fullname").filter(email=email).first()
+        if user_data is None:
             return Response({"detail": "Email not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(user_data)
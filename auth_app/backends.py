@@ -0,0 +1,38 @@
+from django.contrib.auth.backends import ModelBackend
+from auth_app.models import User
+
+class EmailTokenBackend(ModelBackend):
+    """
+    Authentication backend for email/password logins.
+
+    Works like ModelBackend, but loads the user together with its auth token
+    in a single JOINed query, so the login view can read user.auth_token
+    without another round trip.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        """
+        Authenticate a user by email and password.
+
+        Args:
+            request: The current request (may be None).
+            username (str): The user's email (also accepted as 'email' kwarg).
+            password (str): The raw password to check.
+
+        Returns:
+            User instance with auth_token loaded, or None if authentication fails.
+        """
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = User.objects.select_related("auth_token").get(**{User.USERNAME_FIELD: username})
+        except User.DoesNotExist:
+            # Run the password hasher once to reduce the timing difference
+            # between an existing and a nonexistent user.
+            User().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
@@ -19,7 +19,18 @@ class BoardAdmin(admin.ModelAdmin):
         - owner: Owner of the board
     """
     list_display = ('id', 'title', 'owner')
-    
+    # Join only the owner rendered in the list instead of every FK
+    list_select_related = ('owner',)
+
+    def get_queryset(self, request):
+        """
+        Loads only the columns shown in the board list; other admin views keep the full queryset.
+        """
+        qs = super().get_queryset(request)
+        if request.resolver_match.url_name.endswith("_changelist"):
+            return qs.only('id', 'title', 'owner')
+        return qs
+
 
 @admin.register(Task)
 class TaskAdmin(admin.ModelAdmin):
@@ -34,7 +45,19 @@ class TaskAdmin(admin.ModelAdmin):
         - priority: Task priority level
     """
     list_display = ('id', 'title', 'board', 'status', 'priority')
-    
+    # Join only the board rendered in the list instead of every FK
+    list_select_related = ('board',)
+
+    def get_queryset(self, request):
+        """
+        Loads only the columns shown in the task list, plus the assignee and reviewer
+        read by the delete signals; other admin views keep the full queryset.
+        """
+        qs = super().get_queryset(request)
+        if request.resolver_match.url_name.endswith("_changelist"):
+            return qs.only('id', 'title', 'board', 'status', 'priority', 'assignee', 'reviewer')
+        return qs
+
 
 @admin.register(TaskComment)
 class CommentAdmin(admin.ModelAdmin):
@@ -48,4 +71,6 @@ class CommentAdmin(admin.ModelAdmin):
         - created_at: Timestamp of comment creation
     """
     list_display = ('id', 'task', 'author', 'created_at')
+    # Join only the task and author rendered in the list instead of every FK
+    list_select_related = ('task', 'author')
 
@@ -0,0 +1,72 @@
+import copy
+
+from rest_framework import serializers
+
+
+class CachedModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer that builds its fields only once per serializer class.
+
+    ModelSerializer.get_fields() introspects the model and instantiates every
+    field each time a serializer is created. This base class caches the result
+    per class and returns shallow copies, which each instance then binds.
+
+    Only use it for serializers whose fields do not depend on the instance,
+    the data, or the context.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        """
+        Returns shallow copies of the cached fields for this serializer class.
+        """
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {name: copy.copy(field) for name, field in self._fields_cache[cls].items()}
+
+
+class MethodMapViewSetMixin:
+    """
+    ViewSet mixin that selects serializer and permission classes by a dict
+    lookup on the HTTP method instead of per-view if-chains.
+
+    serializer_map / permission_map apply to list routes and fall back to
+    serializer_class / permission_classes. detail_serializer_map /
+    detail_permission_map apply to detail routes and fall back to
+    detail_serializer_class / detail_permission_classes.
+
+    Permission instances are built once per method and view instance, since
+    DRF calls get_permissions() for every permission check of a request.
+    """
+    serializer_map = {}
+    permission_map = {}
+    detail_serializer_class = None
+    detail_serializer_map = {}
+    detail_permission_classes = None
+    detail_permission_map = {}
+
+    def get_serializer_class(self):
+        """
+        Returns the serializer class mapped to the request method and route.
+        """
+        method = self.request.method
+        if self.detail:
+            default = self.detail_serializer_class or self.serializer_class
+            return self.detail_serializer_map.get(method, default)
+        return self.serializer_map.get(method, self.serializer_class)
+
+    def get_permissions(self):
+        """
+        Returns the permission instances mapped to the request method and route.
+        """
+        cache = self.__dict__.setdefault("_permission_cache", {})
+        method = self.request.method
+        if method not in cache:
+            if self.detail:
+                default = self.detail_permission_classes or self.permission_classes
+                classes = self.detail_permission_map.get(method, default)
+            else:
+                classes = self.permission_map.get(method, self.permission_classes)
+            cache[method] = [permission() for permission in classes]
+        return cache[method]
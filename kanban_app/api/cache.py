@@ -0,0 +1,97 @@
+import hashlib
+from functools import wraps
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.db import DatabaseError
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+DATA_VERSION_KEY = "kanban:data-version"
+
+
+def get_data_version():
+    """
+    Returns the current version of the kanban data.
+
+    The version is part of every cached response key, so bumping it
+    invalidates all cached responses at once.
+    """
+    version = cache.get(DATA_VERSION_KEY)
+    if version is None:
+        cache.add(DATA_VERSION_KEY, 1, timeout=None)
+        version = cache.get(DATA_VERSION_KEY, 1)
+    return version
+
+
+def bump_data_version():
+    """
+    Invalidates all cached responses by incrementing the data version.
+    """
+    try:
+        cache.incr(DATA_VERSION_KEY)
+    except ValueError:
+        cache.add(DATA_VERSION_KEY, 1, timeout=None)
+
+
+def cached_response(timeout=15, stale_timeout=600):
+    """
+    Decorator for ViewSet list methods that caches the response data per user.
+
+    The cache key contains the view, the action, the user, the query
+    parameters and the data version; only 200 DRF responses are stored,
+    streaming responses are passed through.
+
+    Cached responses carry an ETag computed from their content. A GET whose
+    If-None-Match matches it is answered with 304 before anything is rendered.
+
+    Every stored response is also kept as a stale fallback, independent of
+    the data version. If the database fails while rebuilding a response, the
+    last fallback is served with an X-Cache: STALE header instead of an error.
+
+    Without a shared cache backend (REDIS_URL unset) the default cache is a
+    DummyCache. Every request would be a miss, so the view is called directly
+    and ConditionalGetMiddleware handles the ETag.
+
+    Args:
+        timeout (int): Seconds a cached response stays valid.
+        stale_timeout (int): Seconds a response is kept as stale fallback.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            if isinstance(caches[DEFAULT_CACHE_ALIAS], DummyCache):
+                return method(self, request, *args, **kwargs)
+            query = hashlib.md5(request.query_params.urlencode().encode()).hexdigest()
+            stale_key = f"kanban:stale:{self.basename}:{self.action}:{request.user.pk}:{query}"
+            key = f"kanban:response:{self.basename}:{self.action}:{request.user.pk}:{get_data_version()}:{query}"
+            entry = cache.get(key)
+            stale = False
+            if entry is None:
+                try:
+                    response = method(self, request, *args, **kwargs)
+                except DatabaseError:
+                    entry = cache.get(stale_key)
+                    if entry is None:
+                        raise
+                    stale = True
+                    response = Response(entry["data"])
+                else:
+                    if response.status_code != 200 or not isinstance(response, Response):
+                        return response
+                    content = JSONRenderer().render(response.data)
+                    entry = {"etag": quote_etag(hashlib.md5(content).hexdigest()), "data": response.data}
+                    cache.set(key, entry, timeout)
+                    cache.set(stale_key, entry, stale_timeout)
+            else:
+                response = Response(entry["data"])
+            if entry["etag"] in parse_etags(request.headers.get("If-None-Match", "")):
+                response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            response["ETag"] = entry["etag"]
+            if stale:
+                response["X-Cache"] = "STALE"
+            return response
+        return wrapper
+    return decorator
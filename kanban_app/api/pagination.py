@@ -0,0 +1,16 @@
+from rest_framework.pagination import CursorPagination
+
+
+class TaskCursorPagination(CursorPagination):
+    """
+    Opt-in keyset pagination for task lists.
+
+    Responses are only paginated when the client sends ?page_size=N, so the
+    plain list responses stay unchanged. Pages are ordered by id, because
+    the default (due_date, priority) ordering contains nullable and
+    non-unique values that cannot serve as a stable cursor.
+    """
+    page_size = None
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('id',)
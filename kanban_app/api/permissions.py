@@ -2,6 +2,25 @@ from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import NotFound
 from kanban_app.models import Task, Board
 
+def get_user_board_ids(request):
+    """
+    Returns the IDs of all boards the requesting user owns or is a member of.
+
+    The set is loaded with one query on first use and cached on the request,
+    so every permission check within the same request reuses it.
+
+    Args:
+        request: DRF request of an authenticated user.
+
+    Returns:
+        set: Board IDs accessible to the user.
+    """
+    board_ids = getattr(request, "_board_ids", None)
+    if board_ids is None:
+        board_ids = set(Board.objects.accessible_ids(request.user))
+        request._board_ids = board_ids
+    return board_ids
+
 class IsBoardMemberForTaskCreate(BasePermission):
     """
     Permission: IsBoardMemberForTaskCreate
@@ -33,10 +52,14 @@ class IsBoardMemberForTaskCreate(BasePermission):
         if not board_id:
             return False
         try:
-            board = Board.objects.get(pk=board_id)
-        except Board.DoesNotExist:
+            board_id = int(board_id)
+        except (TypeError, ValueError):
+            raise NotFound(detail="Board not found.")
+        if board_id in get_user_board_ids(request):
+            return True
+        if not Board.objects.filter(pk=board_id).exists():
             raise NotFound(detail="Board not found.")  #hier war 403
-        return request.user == board.owner or request.user in board.members.all()
+        return False
 
     
 class IsBoardOwner(BasePermission):
@@ -61,7 +84,7 @@ class IsBoardOwner(BasePermission):
         Returns:
             bool: True if user is owner, else False.
         """
-        return request.user == obj.owner
+        return obj.owner_id == request.user.pk
 
 
 class IsBoardMemberOrOwner(BasePermission):
@@ -88,7 +111,7 @@ class IsBoardMemberOrOwner(BasePermission):
         Returns:
             bool: True if user is owner or member.
         """
-        return request.user == obj.owner or request.user in obj.members.all()
+        return obj.owner_id == request.user.pk or obj.pk in get_user_board_ids(request)
 
 
 class IsTaskBoardMemberOrOwner(BasePermission):
@@ -111,6 +134,7 @@ class IsTaskBoardMemberOrOwner(BasePermission):
         """
         Object-level permission alternative for non-object requests.
         Returns True if no pk provided (list endpoint), otherwise checks board membership/ownership.
+        The fetched task is stored on request._task_obj for reuse by the view.
 
         Args:
             request: DRF request.
@@ -126,11 +150,14 @@ class IsTaskBoardMemberOrOwner(BasePermission):
         if not task_id:
             return True
         try:
-            task = Task.objects.get(pk=task_id)
+            # Fetch through the view's queryset, so the cached task carries the
+            # same joins and annotations as a regular get_object() lookup.
+            task = view.get_queryset().get(pk=task_id)
         except Task.DoesNotExist:
             raise NotFound(detail="Task not found.")
-        board = task.board
-        return request.user == board.owner or request.user in board.members.all()
+        # Cache the task so the view can reuse it instead of fetching it again.
+        request._task_obj = task
+        return task.board.owner_id == request.user.pk or task.board_id in get_user_board_ids(request)
 
     def has_object_permission(self, request, view, obj):
         """
@@ -142,8 +169,7 @@ class IsTaskBoardMemberOrOwner(BasePermission):
         Returns:
             bool: True if user is allowed.
         """
-        board = obj.board
-        return request.user == board.owner or request.user in board.members.all()
+        return obj.board_id in get_user_board_ids(request)
 
 
 class IsCommentAuthor(BasePermission):
@@ -168,7 +194,7 @@ class IsCommentAuthor(BasePermission):
         Returns:
             bool: True if user is author, else False.
         """
-        return obj.author == request.user
+        return obj.author_id == request.user.pk
 
 
 class IsTaskCreatorOrBoardOwner(BasePermission):
@@ -190,10 +216,12 @@ class IsTaskCreatorOrBoardOwner(BasePermission):
         Args:
             obj: Task instance.
 
+        The creator is checked first via creator_id, so the board is only
+        dereferenced when the user is not the creator.
+
         Returns:
             bool: True if user is creator or board owner.
         """
-        board = obj.board
-        return (
-            hasattr(obj, "creator") and obj.creator == request.user
-        ) or (board.owner == request.user)
+        if getattr(obj, "creator_id", None) == request.user.pk:
+            return True
+        return obj.board.owner_id == request.user.pk
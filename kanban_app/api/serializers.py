@@ -1,10 +1,52 @@
+from collections.abc import Mapping
+
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from kanban_app.models import Task, Board, TaskComment
+from kanban_app.api.base import CachedModelSerializer
 
 User = get_user_model()
 
-class UserShortSerializer(serializers.ModelSerializer):
+# Users resolved from assignee_id/reviewer_id are only checked by pk and then
+# rendered via UserShortSerializer, so their other columns are never needed.
+USER_SHORT_QS = User.objects.only("id", "email", "fullname")
+
+def validate_user_ids(user_ids):
+    """
+    Checks that all given IDs belong to existing users.
+
+    Compares a single COUNT against the number of distinct IDs; the existing
+    IDs are only fetched to build the error message when validation fails.
+
+    Raises:
+        ValidationError: If unknown IDs are provided.
+    """
+    unique_ids = set(user_ids)
+    if User.objects.filter(id__in=unique_ids).count() != len(unique_ids):
+        existing_ids = set(User.objects.filter(id__in=unique_ids).values_list('id', flat=True))
+        raise serializers.ValidationError(f"User IDs {unique_ids - existing_ids} do not exist.")
+
+def _board_principal_ids(board, user_ids):
+    """
+    Returns the subset of user_ids that are the owner or a member of the board.
+
+    The owner is checked in Python; only the remaining IDs are looked up in
+    the membership table, restricted to those IDs in a single query.
+
+    Args:
+        board (Board): The board to check against.
+        user_ids (set): IDs of the users to check.
+
+    Returns:
+        set: IDs from user_ids allowed on the board.
+    """
+    allowed_ids = user_ids & {board.owner_id}
+    remaining_ids = user_ids - allowed_ids
+    if remaining_ids:
+        allowed_ids |= set(board.members.filter(pk__in=remaining_ids).values_list('id', flat=True))
+    return allowed_ids
+
+class UserShortSerializer(CachedModelSerializer):
     """
     Serializer to return minimal user info (used for task/board member listing).
     Fields: id, email, fullname.
@@ -13,17 +55,19 @@ class UserShortSerializer(serializers.ModelSerializer):
         model = User
         fields = ["id", "email", "fullname"]
 
-class BoardListSerializer(serializers.ModelSerializer):
+class BoardListSerializer(CachedModelSerializer):
     """
     Serializer for listing boards with statistics.
 
     Includes counts for members, tickets, to-do tasks, and high-priority tasks.
+    member_count is read from the annotation set by BoardViewSet.get_queryset,
+    the task counts from the denormalized columns on Board.
     """
-    member_count = serializers.IntegerField(source="members.count", read_only=True)
-    ticket_count = serializers.IntegerField(source="tasks.count", read_only=True)
-    tasks_to_do_count = serializers.SerializerMethodField()
-    tasks_high_prio_count = serializers.SerializerMethodField()
-    owner_id = serializers.IntegerField(source="owner.id", read_only=True)
+    member_count = serializers.IntegerField(read_only=True)
+    ticket_count = serializers.IntegerField(read_only=True)
+    tasks_to_do_count = serializers.IntegerField(read_only=True)
+    tasks_high_prio_count = serializers.IntegerField(read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Board
@@ -31,18 +75,6 @@ class BoardListSerializer(serializers.ModelSerializer):
             "id", "title", "member_count", "ticket_count",
             "tasks_to_do_count", "tasks_high_prio_count", "owner_id"
         ]
-    
-    def get_tasks_to_do_count(self, obj):
-        """
-        Returns the number of tasks on this board with status 'to-do'.
-        """
-        return obj.tasks.filter(status="to-do").count()
-
-    def get_tasks_high_prio_count(self, obj):
-        """
-        Returns the number of high-priority tasks on this board.
-        """
-        return obj.tasks.filter(priority="high").count()
 
 class BoardUpdateInputSerializer(serializers.ModelSerializer):
     """
@@ -62,11 +94,7 @@ class BoardUpdateInputSerializer(serializers.ModelSerializer):
         Raises ValidationError if unknown IDs are provided.
         """
         if value is not None:
-            from auth_app.models import User
-            existing_ids = set(User.objects.filter(id__in=value).values_list('id', flat=True))
-            invalid_ids = set(value) - existing_ids
-            if invalid_ids:
-                raise serializers.ValidationError(f"User IDs {invalid_ids} do not exist.")
+            validate_user_ids(value)
         return value
 
     def update(self, instance, validated_data):
@@ -78,7 +106,7 @@ class BoardUpdateInputSerializer(serializers.ModelSerializer):
             instance.title = validated_data['title']
         if members is not None:
             instance.members.set(members)
-        instance.save()
+        instance.save(update_fields=["title"])
         return instance
 
 class BoardUpdateResponseSerializer(serializers.ModelSerializer):
@@ -86,34 +114,24 @@ class BoardUpdateResponseSerializer(serializers.ModelSerializer):
     Output serializer for PATCH board response.
     Returns: id, title, owner_data (user object), members_data (list of user objects).
     """
-    owner_data = serializers.SerializerMethodField()
-    members_data = serializers.SerializerMethodField()
+    owner_data = UserShortSerializer(source='owner', read_only=True)
+    members_data = UserShortSerializer(source='members', many=True, read_only=True)
 
     class Meta:
         model = Board
         fields = ['id', 'title', 'owner_data', 'members_data']
-    
-    def get_owner_data(self, obj):
-        """
-        Returns serialized owner data.
-        """
-        return UserShortSerializer(obj.owner).data
-    
-    def get_members_data(self, obj):
-        """
-        Returns list of serialized member data.
-        """
-        return UserShortSerializer(obj.members.all(), many=True).data
 
-class SimpleTaskSerializer(serializers.ModelSerializer):
+class SimpleTaskSerializer(CachedModelSerializer):
     """
     Basic serializer for tasks as embedded in board detail view.
 
     Includes assignee/reviewer as objects and comment count.
+    comments_count is read from the annotation set by BoardViewSet.retrieve,
+    which also attaches assignee and reviewer from the board's loaded users.
     """
     assignee = UserShortSerializer(read_only=True)
     reviewer = UserShortSerializer(read_only=True)
-    comments_count = serializers.SerializerMethodField()
+    comments_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Task
@@ -121,12 +139,6 @@ class SimpleTaskSerializer(serializers.ModelSerializer):
             "id", "title", "description", "status", "priority",
             "assignee", "reviewer", "due_date", "comments_count"
         ]
-    
-    def get_comments_count(self, obj):
-        """
-        Returns number of comments on the task.
-        """
-        return obj.comments.count()
 
 class BoardDetailGetSerializer(serializers.ModelSerializer):
     """
@@ -134,7 +146,7 @@ class BoardDetailGetSerializer(serializers.ModelSerializer):
 
     Returns board info plus all members (minified) and all tasks (simple).
     """
-    owner_id = serializers.IntegerField(source="owner.id", read_only=True)
+    owner_id = serializers.IntegerField(read_only=True)
     members = UserShortSerializer(many=True, read_only=True)
     tasks = SimpleTaskSerializer(many=True, read_only=True)
 
@@ -158,11 +170,7 @@ class BoardCreateInputSerializer(serializers.ModelSerializer):
         Checks that all member IDs are valid users.
         Raises ValidationError if not.
         """
-        from auth_app.models import User
-        existing = set(User.objects.filter(id__in=value).values_list('id', flat=True))
-        invalid = set(value) - existing
-        if invalid:
-            raise serializers.ValidationError(f"User IDs {invalid} do not exist.")
+        validate_user_ids(value)
         return value
     
     def create(self, validated_data):
@@ -180,17 +188,18 @@ class BoardCreateInputSerializer(serializers.ModelSerializer):
         board.members.set(members)
         return board
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(CachedModelSerializer):
     """
     Detailed serializer for tasks.
 
     Handles write and read representations for assignee, reviewer, and validates access.
+    comments_count is read from a queryset annotation set by the task views.
     """
     assignee = UserShortSerializer(read_only=True)
     reviewer = UserShortSerializer(read_only=True)
-    assignee_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(),source='assignee',write_only=True,required=False,allow_null=True)
-    reviewer_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(),source='reviewer',write_only=True,required=False,allow_null=True)
-    comments_count = serializers.SerializerMethodField()
+    assignee_id = serializers.PrimaryKeyRelatedField(queryset=USER_SHORT_QS,source='assignee',write_only=True,required=False,allow_null=True)
+    reviewer_id = serializers.PrimaryKeyRelatedField(queryset=USER_SHORT_QS,source='reviewer',write_only=True,required=False,allow_null=True)
+    comments_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Task
@@ -203,25 +212,28 @@ class TaskSerializer(serializers.ModelSerializer):
             "id", "comments_count", "assignee", "reviewer"
         ]
     
-    def validate_board(self, value):
+    def to_internal_value(self, data):
         """
         Ensures board field cannot be updated after creation.
-        """
-        if self.instance and self.instance.board_id != value.id:
-            raise serializers.ValidationError("Board cannot be changed.")
-        return value
 
-    def get_comments_count(self, obj):
-        """
-        Returns number of comments for this task.
+        Compares the raw board ID with instance.board_id before the board
+        field resolves it, so a rejected change does not load the Board.
+        Data that is not a mapping is left to DRF's own validation error.
         """
-        return obj.comments.count()
+        if self.instance is not None and isinstance(data, Mapping) and 'board' in data:
+            try:
+                board_id = int(data['board'])
+            except (TypeError, ValueError):
+                board_id = None
+            if board_id is not None and board_id != self.instance.board_id:
+                raise serializers.ValidationError({'board': ["Board cannot be changed."]})
+        return super().to_internal_value(data)
 
     def validate_status(self, value):
         """
         Ensures status value is valid.
         """
-        if value not in dict(Task.STATUS_CHOICES):
+        if value not in Task.STATUS_VALUES:
             raise serializers.ValidationError("Invalid status.")
         return value
 
@@ -229,7 +241,7 @@ class TaskSerializer(serializers.ModelSerializer):
         """
         Ensures priority value is valid.
         """
-        if value not in dict(Task.PRIORITY_CHOICES):
+        if value not in Task.PRIORITY_VALUES:
             raise serializers.ValidationError("Invalid priority.")
         return value
     
@@ -241,27 +253,28 @@ class TaskSerializer(serializers.ModelSerializer):
         board = attrs.get('board') or self.instance.board
         assignee = attrs.get('assignee')
         reviewer = attrs.get('reviewer')
-        
-        if assignee:
-            if assignee not in board.members.all() and assignee != board.owner:
-                raise serializers.ValidationError({'assignee': 'Assignee must be a board member or owner'})
-        
-        if reviewer:
-            if reviewer not in board.members.all() and reviewer != board.owner:
-                raise serializers.ValidationError({'reviewer': 'Reviewer must be a board member or owner'})
+        if not (assignee or reviewer):
+            return attrs
+
+        allowed_ids = _board_principal_ids(board, {user.pk for user in (assignee, reviewer) if user})
+        if assignee and assignee.pk not in allowed_ids:
+            raise serializers.ValidationError({'assignee': 'Assignee must be a board member or owner'})
+        if reviewer and reviewer.pk not in allowed_ids:
+            raise serializers.ValidationError({'reviewer': 'Reviewer must be a board member or owner'})
         return attrs
 
-class TaskUpdateSerializer(serializers.ModelSerializer):
+class TaskUpdateSerializer(CachedModelSerializer):
     """
     Serializer for updating task data (PATCH).
     Prevents board modification.
     Validates all assignments and choices.
+    comments_count is read from the annotation set by TaskViewSet.
     """
     assignee = UserShortSerializer(read_only=True)
     reviewer = UserShortSerializer(read_only=True)
-    assignee_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(),source='assignee',write_only=True,required=False,allow_null=True)
-    reviewer_id = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(),source='reviewer',write_only=True,required=False,allow_null=True)
-    comments_count = serializers.SerializerMethodField()
+    assignee_id = serializers.PrimaryKeyRelatedField(queryset=USER_SHORT_QS,source='assignee',write_only=True,required=False,allow_null=True)
+    reviewer_id = serializers.PrimaryKeyRelatedField(queryset=USER_SHORT_QS,source='reviewer',write_only=True,required=False,allow_null=True)
+    comments_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Task
@@ -273,17 +286,11 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
             "id", "comments_count", "assignee", "reviewer"
         ]
 
-    def get_comments_count(self, obj):
-        """
-        Number of comments for this task.
-        """
-        return obj.comments.count()
-
     def validate_status(self, value):
         """
         Ensures status choice is valid.
         """
-        if value not in dict(Task.STATUS_CHOICES):
+        if value not in Task.STATUS_VALUES:
             raise serializers.ValidationError("Invalid status choice.")
         return value
 
@@ -291,7 +298,7 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
         """
         Ensures priority choice is valid.
         """
-        if value not in dict(Task.PRIORITY_CHOICES):
+        if value not in Task.PRIORITY_VALUES:
             raise serializers.ValidationError("Invalid priority choice.")
         return value
 
@@ -307,30 +314,27 @@ class TaskUpdateSerializer(serializers.ModelSerializer):
         board = self.instance.board
         assignee = attrs.get('assignee')
         reviewer = attrs.get('reviewer')
+        if not (assignee or reviewer):
+            return attrs
 
-        if assignee and assignee not in board.members.all() and assignee != board.owner:
+        allowed_ids = _board_principal_ids(board, {user.pk for user in (assignee, reviewer) if user})
+        if assignee and assignee.pk not in allowed_ids:
             raise serializers.ValidationError({'assignee': 'Assignee must be a member or owner of the board.'})
-        if reviewer and reviewer not in board.members.all() and reviewer != board.owner:
+        if reviewer and reviewer.pk not in allowed_ids:
             raise serializers.ValidationError({'reviewer': 'Reviewer must be a member or owner of the board.'})
         return attrs
 
-class TaskCommentSerializer(serializers.ModelSerializer):
+class TaskCommentSerializer(CachedModelSerializer):
     """
     Serializer for task comments.
 
     Includes author as fullname only (string), all fields read-only except content.
     """
-    author = serializers.SerializerMethodField()
+    author = serializers.CharField(source='author.fullname', read_only=True, default=None)
 
     class Meta:
         model = TaskComment
         fields = ["id", "created_at", "author", "content"]
         read_only_fields = ["id", "created_at", "author"]
 
-    def get_author(self, obj):
-        """
-        Returns author's fullname for the comment.
-        """
-        return obj.author.fullname if obj.author else None
-
 
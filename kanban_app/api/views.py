@@ -1,12 +1,18 @@
-from django.db.models import Q
-from rest_framework import generics, status
+from django.contrib.auth import get_user_model
+from django.http import StreamingHttpResponse
+from django.db.models import Count, Prefetch, prefetch_related_objects
+from rest_framework import mixins, status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.generics import DestroyAPIView
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
 from rest_framework.exceptions import NotFound
 
-from kanban_app.models import Board, Task, TaskComment
+from kanban_app.models import Board, Task, TaskComment, UserTaskStats
+from kanban_app.api.base import MethodMapViewSetMixin
+from kanban_app.api.cache import cached_response
+from kanban_app.api.pagination import TaskCursorPagination
 from kanban_app.api.serializers import (
     BoardCreateInputSerializer,
     BoardDetailGetSerializer,
@@ -16,6 +22,7 @@ from kanban_app.api.serializers import (
     TaskSerializer,
     TaskCommentSerializer,
     TaskUpdateSerializer,
+    UserShortSerializer,
 )
 from kanban_app.api.permissions import (
     IsBoardMemberForTaskCreate,
@@ -26,91 +33,152 @@ from kanban_app.api.permissions import (
     IsTaskCreatorOrBoardOwner,
 )
 
+User = get_user_model()
 
-class BoardListCreateView(generics.ListCreateAPIView):
+
+def only_user_short(qs, *relations):
+    """
+    Restrict the given select_related() user relations to the columns
+    rendered by UserShortSerializer, keeping all columns of the model itself.
+
+    Args:
+        qs (QuerySet): Queryset that joins the user relations.
+        *relations (str): Names of the joined user relations.
+
+    Returns:
+        QuerySet: The queryset with an only() projection applied.
+    """
+    fields = [field.name for field in qs.model._meta.concrete_fields]
+    fields += [f"{relation}__{name}" for relation in relations for name in UserShortSerializer.Meta.fields]
+    return qs.only(*fields)
+
+
+class BoardViewSet(MethodMapViewSetMixin,
+                   mixins.ListModelMixin,
+                   mixins.CreateModelMixin,
+                   mixins.RetrieveModelMixin,
+                   mixins.UpdateModelMixin,
+                   mixins.DestroyModelMixin,
+                   viewsets.GenericViewSet):
     """
-    API endpoint for listing and creating boards.
+    API endpoints for boards.
 
-    - GET: Returns all boards where the user is owner or member.
-    - POST: Creates a new board and assigns the requesting user as owner.
+    - GET /boards/: Returns all boards where the user is owner or member.
+    - POST /boards/: Creates a new board and assigns the requesting user as owner.
+    - GET /boards/{id}/: Returns board details, including members and tasks.
+    - PATCH /boards/{id}/: Updates board title/members.
+    - DELETE /boards/{id}/: Deletes the board (owner only).
 
-    Uses BoardListSerializer for GET output,
-    BoardCreateInputSerializer for POST input.
-    Access restricted to authenticated users.
+    Uses BoardListSerializer for list output, BoardCreateInputSerializer for
+    POST input, BoardDetailGetSerializer for detail output and
+    BoardUpdateInputSerializer for PATCH input.
+    Permissions depend on the request method.
     """
 
     queryset = Board.objects.all()
+    serializer_class = BoardListSerializer
+    serializer_map = {'POST': BoardCreateInputSerializer}
+    detail_serializer_class = BoardDetailGetSerializer
+    detail_serializer_map = {'PATCH': BoardUpdateInputSerializer}
     permission_classes = [IsAuthenticated]
+    detail_permission_classes = [IsAuthenticated, IsBoardMemberOrOwner]
+    detail_permission_map = {'DELETE': [IsAuthenticated, IsBoardOwner]}
+    lookup_value_regex = r"\d+"
 
     def get_queryset(self):
         """
-        Get all boards where the current user is owner or member.
+        Get boards for the current request.
+
+        Detail requests get boards with their owner joined in. List requests get
+        all boards where the current user is owner or member, annotated with the
+        member count used by BoardListSerializer; the task counts are
+        denormalized columns on Board.
 
         Returns:
-            QuerySet of Board instances for the user.
+            QuerySet of Board instances.
         """
-        user = self.request.user
-        return Board.objects.filter(Q(owner=user) | Q(members=user)).distinct()
-    
-    def get_serializer_class(self):
+        if self.detail:
+            return only_user_short(Board.objects.select_related("owner"), "owner")
+        board_ids = Board.objects.accessible_ids(self.request.user)
+        # Meta.ordering is not applied to aggregated querysets, so it is set explicitly.
+        return Board.objects.filter(id__in=board_ids).annotate(
+            member_count=Count("members"),
+        ).order_by(*Board._meta.ordering)
+
+    @cached_response()
+    def list(self, request, *args, **kwargs):
         """
-        Select serializer based on request method.
+        List the user's boards as plain dicts read from the annotated queryset.
+
+        All BoardListSerializer fields are columns or annotations, so rows are
+        returned via values() without building Board instances.
 
         Returns:
-            BoardCreateInputSerializer for POST, BoardListSerializer for GET.
+            HTTP 200 response with the list of boards.
         """
-        if self.request.method == 'POST':
-            return BoardCreateInputSerializer 
-        return BoardListSerializer                  
+        boards = self.get_queryset().values(*BoardListSerializer.Meta.fields)
+        return Response(list(boards))
 
     def create(self, request, *args, **kwargs):
         """
         Create a new board instance with POST data.
 
+        The response row is read via values() like in list().
+
         Returns:
             HTTP 201 response with serialized board data.
         """
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         board = serializer.save()
-        output = BoardListSerializer(board)
-        return Response(output.data, status=status.HTTP_201_CREATED)
-
+        output = self.get_queryset().values(*BoardListSerializer.Meta.fields).get(pk=board.pk)
+        return Response(output, status=status.HTTP_201_CREATED)
 
-class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
-    """
-    API endpoint for retrieving, updating, and deleting boards.
-
-    - GET: Returns board details, including members and tasks.
-    - PATCH: Updates board title/members.
-    - DELETE: Deletes the board (owner only).
-
-    Uses BoardDetailGetSerializer for output, BoardUpdateInputSerializer for input.
-    Permissions depend on the request method.
-    """
-
-    queryset = Board.objects.all()
-    permission_classes = [IsAuthenticated]
-
-    def get_permissions(self):
+    def retrieve(self, request, *args, **kwargs):
         """
-        Return permissions based on request method.
+        Return board details with members and tasks.
 
-        DELETE requires IsBoardOwner, others require IsBoardMemberOrOwner.
+        Members and tasks (with comment count) are prefetched after the
+        permission check, in a fixed number of queries independent of the
+        task count. Assignees and reviewers are attached via attach_task_users.
         """
-        if self.request.method == 'DELETE':
-            return [IsAuthenticated(), IsBoardOwner()]
-        return [IsAuthenticated(), IsBoardMemberOrOwner()]
+        instance = self.get_object()
+        members = User.objects.only(*UserShortSerializer.Meta.fields)
+        tasks = Task.objects.with_comments_count()
+        prefetch_related_objects(
+            [instance], Prefetch("members", queryset=members), Prefetch("tasks", queryset=tasks)
+        )
+        self.attach_task_users(instance)
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
 
-    def get_serializer_class(self):
+    def attach_task_users(self, board):
         """
-        Select serializer based on request method.
+        Set assignee and reviewer of the board's prefetched tasks.
 
-        PATCH uses BoardUpdateInputSerializer, others use BoardDetailGetSerializer.
-        """
-        if self.request.method == 'PATCH':
-            return BoardUpdateInputSerializer
-        return BoardDetailGetSerializer
+        Assignees and reviewers are almost always the board's owner or members,
+        which are already loaded, so the tasks share those User instances instead
+        of JOINing a User row per task. Users who are no longer on the board are
+        fetched in one extra query.
+
+        Args:
+            board: Board instance with owner, members and tasks loaded.
+        """
+        users = {user.pk: user for user in board.members.all()}
+        users[board.owner_id] = board.owner
+        tasks = board.tasks.all()
+        missing_ids = {
+            user_id
+            for task in tasks
+            for user_id in (task.assignee_id, task.reviewer_id)
+            if user_id is not None and user_id not in users
+        }
+        if missing_ids:
+            missing_users = User.objects.only(*UserShortSerializer.Meta.fields).filter(pk__in=missing_ids)
+            users.update((user.pk, user) for user in missing_users)
+        for task in tasks:
+            task.assignee = users.get(task.assignee_id)
+            task.reviewer = users.get(task.reviewer_id)
 
     def update(self, request, *args, **kwargs):
         """
@@ -132,84 +200,110 @@ class BoardDetailView(generics.RetrieveUpdateDestroyAPIView):
         return Response(response_serializer.data, status=status.HTTP_200_OK)
 
 
-class TaskListCreateView(generics.ListCreateAPIView):
+class TaskViewSet(MethodMapViewSetMixin,
+                  mixins.ListModelMixin,
+                  mixins.CreateModelMixin,
+                  mixins.RetrieveModelMixin,
+                  mixins.UpdateModelMixin,
+                  mixins.DestroyModelMixin,
+                  viewsets.GenericViewSet):
     """
-    API endpoint for listing and creating tasks.
+    API endpoints for tasks.
 
-    - GET: List all tasks for a board (if board_id is provided).
-    - POST: Create new task, only if user is board member or owner.
+    - GET /tasks/: List all tasks for a board (if board_id is provided).
+    - POST /tasks/: Create new task, only if user is board member or owner.
+    - GET /tasks/{id}/: Returns task details.
+    - PATCH /tasks/{id}/: Updates allowed task fields.
+    - DELETE /tasks/{id}/: Removes task (creator or board owner only).
+    - GET /tasks/assigned-to-me/: Tasks assigned to the current user.
+    - GET /tasks/reviewing/: Tasks the current user reviews.
+    - GET /tasks/stats/: Open task counters of the current user.
 
-    Uses TaskSerializer for all operations.
-    Access requires authentication and board membership.
+    Task lists are paginated by TaskCursorPagination when ?page_size=N is given,
+    and streamed when ?stream=1 is given.
+
+    Serializer and permissions vary by route and method.
     """
     queryset = Task.objects.all()
-    permission_classes = [IsAuthenticated, IsBoardMemberForTaskCreate]
     serializer_class = TaskSerializer
+    detail_serializer_map = {'PATCH': TaskUpdateSerializer}
+    # The assigned-to-me, reviewing and stats actions narrow this to IsAuthenticated.
+    permission_classes = [IsAuthenticated, IsBoardMemberForTaskCreate]
+    detail_permission_classes = [IsAuthenticated, IsTaskBoardMemberOrOwner]
+    detail_permission_map = {'DELETE': [IsAuthenticated, IsTaskCreatorOrBoardOwner]}
+    pagination_class = TaskCursorPagination
+    lookup_value_regex = r"\d+"
 
     def get_queryset(self):
         """
-        Get all tasks, optionally filtered by board.
+        Get tasks for the current route, optionally filtered by board.
 
         Returns:
             QuerySet of Task instances.
         """
-        qs = super().get_queryset()
+        qs = only_user_short(Task.objects.full(), "assignee", "reviewer")
+        if not self.detail:
+            # List rows are only serialized, never saved, so unrendered columns are skipped.
+            qs = qs.defer("creator", "created_at", "updated_at")
+        if self.action == 'assigned_to_me':
+            return qs.filter(assignee=self.request.user)
+        if self.action == 'reviewing':
+            return qs.filter(reviewer=self.request.user)
+        if self.detail:
+            # The board is read by the permission checks and task validation.
+            qs = qs.select_related("board")
         board_id = self.request.query_params.get("board")
         if board_id:
             qs = qs.filter(board_id=board_id)
         return qs
 
-    def perform_create(self, serializer):
+    def list(self, request, *args, **kwargs):
         """
-        Save new task and set the creator field automatically.
+        List tasks, streaming the JSON array when ?stream=1 is given.
 
-        Args:
-            serializer: TaskSerializer instance.
+        Unpaginated exports can be large, so with stream=1 the rows are read
+        with iterator() in chunks and serialized one at a time instead of
+        loading the whole list into memory.
         """
-        serializer.save(creator=self.request.user)
-
+        if request.query_params.get("stream") != "1":
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+        renderer = JSONRenderer()
 
-class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
-    """
-    API endpoint for retrieving, updating, and deleting a specific task.
+        def rows():
+            yield b"["
+            for index, task in enumerate(queryset.iterator(chunk_size=500)):
+                if index:
+                    yield b","
+                yield renderer.render(serializer.to_representation(task))
+            yield b"]"
 
-    - GET: Returns task details.
-    - PATCH: Updates allowed task fields.
-    - DELETE: Removes task (creator or board owner only).
+        return StreamingHttpResponse(rows(), content_type="application/json")
 
-    Serializer and permissions vary by method.
-    """
-    queryset = Task.objects.all()
-    lookup_field = 'pk'
-    
-    def get_permissions(self):
+    def get_object(self):
         """
-        Permissions set based on method.
+        Return the task, reusing the instance cached by IsTaskBoardMemberOrOwner.
 
-        DELETE uses IsTaskCreatorOrBoardOwner, others use IsTaskBoardMemberOrOwner.
+        Falls back to the regular lookup if no task was cached.
         """
-        if self.request.method == 'DELETE':
-            return [IsAuthenticated(), IsTaskCreatorOrBoardOwner()]
-        return [IsAuthenticated(), IsTaskBoardMemberOrOwner()]
+        task = getattr(self.request, "_task_obj", None)
+        if task is None:
+            return super().get_object()
+        self.check_object_permissions(self.request, task)
+        return task
 
-    def get_serializer_class(self):
-        """
-        Return TaskUpdateSerializer for PATCH, else TaskSerializer.
+    def perform_create(self, serializer):
         """
-        if self.request.method == 'PATCH':
-            return TaskUpdateSerializer
-        return TaskSerializer
+        Save new task and set the creator field automatically.
 
-    def get_queryset(self):
-        """
-        Get tasks, optionally filtered by board.
+        Args:
+            serializer: TaskSerializer instance.
         """
-        qs = super().get_queryset()
-        board_id = self.request.query_params.get("board")
-        if board_id:
-            qs = qs.filter(board_id=board_id)
-        return qs
-    
+        task = serializer.save(creator=self.request.user)
+        # A new task has no comments; set the value the list queryset annotates.
+        task.comments_count = 0
+
     def update(self, request, *args, **kwargs):
         """
         Update task data. Checks object permissions before applying update.
@@ -222,59 +316,56 @@ class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
         self.perform_update(serializer)
         return Response(serializer.data)
 
-
-class TaskAssignedToMeListView(generics.ListAPIView):
-    """
-    API endpoint to list all tasks assigned to the current user.
-
-    Uses TaskSerializer for output.
-    Access is restricted to authenticated users.
-    """
-    serializer_class = TaskSerializer
-    permission_classes = [IsAuthenticated]
-
-    def get_queryset(self):
+    @action(detail=False, url_path='assigned-to-me', permission_classes=[IsAuthenticated])
+    @cached_response()
+    def assigned_to_me(self, request):
         """
-        Get all tasks assigned to the current user.
-
-        Returns:
-            QuerySet of Task instances.
+        List all tasks assigned to the current user.
         """
-        return Task.objects.filter(assignee=self.request.user)
-
+        return self.list(request)
 
-class TaskReviewingListView(generics.ListAPIView):
-    """
-    API endpoint to list all tasks for which the current user is reviewer.
-
-    Uses TaskSerializer for output.
-    Access is restricted to authenticated users.
-    """
-    serializer_class = TaskSerializer
-    permission_classes = [IsAuthenticated]
+    @action(detail=False, permission_classes=[IsAuthenticated])
+    @cached_response()
+    def reviewing(self, request):
+        """
+        List all tasks for which the current user is reviewer.
+        """
+        return self.list(request)
 
-    def get_queryset(self):
+    @action(detail=False, permission_classes=[IsAuthenticated])
+    def stats(self, request):
         """
-        Get all tasks where current user is reviewer.
+        Return the current user's open task counters.
 
-        Returns:
-            QuerySet of Task instances.
+        Reads the denormalized UserTaskStats row instead of counting tasks.
         """
-        return Task.objects.filter(reviewer=self.request.user)
+        stats = UserTaskStats.objects.filter(user=request.user).values(
+            "assigned_open_count", "reviewing_open_count"
+        ).first()
+        return Response(stats or {"assigned_open_count": 0, "reviewing_open_count": 0})
 
 
-class TaskCommentListCreateView(generics.ListCreateAPIView):
+class TaskCommentViewSet(MethodMapViewSetMixin,
+                         mixins.ListModelMixin,
+                         mixins.CreateModelMixin,
+                         mixins.DestroyModelMixin,
+                         viewsets.GenericViewSet):
     """
-    API endpoint to list and create comments for a specific task.
+    API endpoints for the comments of a specific task.
 
-    - GET: Lists all comments for a task (sorted by creation).
-    - POST: Creates a new comment for the task, author is request.user.
+    - GET /tasks/{task_id}/comments/: Lists all comments for a task (sorted by creation).
+    - POST /tasks/{task_id}/comments/: Creates a new comment, author is request.user.
+    - DELETE /tasks/{task_id}/comments/{comment_id}/: Deletes a comment (author only).
 
     Uses TaskCommentSerializer for all operations.
-    Access controlled by IsTaskBoardMemberOrOwner.
+    Listing and creating is controlled by IsTaskBoardMemberOrOwner,
+    deleting by IsCommentAuthor.
     """
     serializer_class = TaskCommentSerializer
     permission_classes = [IsAuthenticated, IsTaskBoardMemberOrOwner]
+    detail_permission_classes = [IsAuthenticated, IsCommentAuthor]
+    lookup_url_kwarg = "comment_id"
+    lookup_value_regex = r"\d+"
 
     def get_queryset(self):
         """
@@ -283,15 +374,13 @@ class TaskCommentListCreateView(generics.ListCreateAPIView):
         Returns:
             QuerySet of TaskComment instances for the task.
         Raises:
-            NotFound: If the task does not exist.
+            NotFound: If the task does not exist (list route).
         """
         task_id = self.kwargs["task_id"]
-        try:
-            task = Task.objects.get(id=task_id)
-        except Task.DoesNotExist:
-            raise NotFound("Task not found.")
-        self.check_object_permissions(self.request, task)
-        return TaskComment.objects.filter(task_id=task_id).order_by("created_at")
+        if self.detail:
+            return TaskComment.objects.filter(task_id=task_id)
+        self._get_task()
+        return TaskComment.objects.with_author().filter(task_id=task_id).order_by("created_at")
 
     def perform_create(self, serializer):
         """
@@ -301,33 +390,26 @@ class TaskCommentListCreateView(generics.ListCreateAPIView):
         Raises:
             NotFound: If the task does not exist.
         """
-        task_id = self.kwargs["task_id"]
-        try:
-            task = Task.objects.get(id=task_id)
-        except Task.DoesNotExist:
-            raise NotFound("Task not found.")
-        self.check_object_permissions(self.request, task)
-        serializer.save(author=self.request.user, task=task)
-
+        serializer.save(author=self.request.user, task=self._get_task())
 
-class TaskCommentDestroyView(DestroyAPIView):
-    """
-    API endpoint to delete a specific comment for a task.
-
-    Only the comment author may delete their own comment.
-    Uses TaskCommentSerializer for output.
-    """
-    serializer_class = TaskCommentSerializer
-    permission_classes = [IsAuthenticated, IsCommentAuthor]
-
-    def get_queryset(self):
+    def _get_task(self):
         """
-        Get all comments for the specified task.
+        Fetch the task from the URL and check board access, once per request.
 
         Returns:
-            QuerySet of TaskComment instances.
+            Task instance.
+        Raises:
+            NotFound: If the task does not exist.
         """
-        return TaskComment.objects.filter(task_id=self.kwargs["task_id"])
+        if not hasattr(self, "_task"):
+            try:
+                # Only the board is needed for the access check and the comment FK.
+                task = Task.objects.only("id", "board").get(id=self.kwargs["task_id"])
+            except Task.DoesNotExist:
+                raise NotFound("Task not found.")
+            self.check_object_permissions(self.request, task)
+            self._task = task
+        return self._task
 
     def get_object(self):
         """
@@ -342,10 +424,8 @@ class TaskCommentDestroyView(DestroyAPIView):
         comment_id = self.kwargs.get("comment_id")
         
         try:
-            comment = TaskComment.objects.get(id=comment_id, task__id=task_id)
+            comment = TaskComment.objects.get(id=comment_id, task_id=task_id)
             self.check_object_permissions(self.request, comment)
             return comment
         except TaskComment.DoesNotExist:
             raise NotFound(detail="Comment not found or does not belong to this task.")
-
-
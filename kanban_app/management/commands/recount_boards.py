@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from kanban_app.models import Board
+
+
+class Command(BaseCommand):
+    """
+    Rebuilds the denormalized task counters of all boards.
+
+    Usage:
+        python manage.py recount_boards
+    """
+    help = "Recompute ticket_count, tasks_to_do_count and tasks_high_prio_count for all boards."
+
+    def handle(self, *args, **options):
+        updated = Board.objects.all().update_task_counts()
+        self.stdout.write(self.style.SUCCESS(f"Updated task counters of {updated} boards."))
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.6 on 2026-10-15 01:49
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_task_counts(apps, schema_editor):
+    Board = apps.get_model('kanban_app', 'Board')
+    Task = apps.get_model('kanban_app', 'Task')
+
+    def task_count(**filters):
+        tasks = (
+            Task.objects.filter(board=OuterRef('pk'), **filters)
+            .order_by()
+            .values('board')
+            .annotate(count=Count('id'))
+            .values('count')
+        )
+        return Coalesce(Subquery(tasks), 0)
+
+    Board.objects.update(
+        ticket_count=task_count(),
+        tasks_to_do_count=task_count(status='to-do'),
+        tasks_high_prio_count=task_count(priority='high'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kanban_app', '0003_task_board_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='board',
+            name='tasks_high_prio_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='tasks_to_do_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='board',
+            name='ticket_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_task_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.6 on 2026-10-15 01:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_user_task_stats(apps, schema_editor):
+    Task = apps.get_model('kanban_app', 'Task')
+    UserTaskStats = apps.get_model('kanban_app', 'UserTaskStats')
+
+    user_ids = set(Task.objects.values_list('assignee_id', flat=True))
+    user_ids |= set(Task.objects.values_list('reviewer_id', flat=True))
+    user_ids.discard(None)
+    UserTaskStats.objects.bulk_create([UserTaskStats(user_id=user_id) for user_id in user_ids])
+
+    def open_task_count(user_field):
+        tasks = (
+            Task.objects.filter(**{user_field: OuterRef('user_id')})
+            .exclude(status='done')
+            .order_by()
+            .values(user_field)
+            .annotate(count=Count('id'))
+            .values('count')
+        )
+        return Coalesce(Subquery(tasks), 0)
+
+    UserTaskStats.objects.update(
+        assigned_open_count=open_task_count('assignee'),
+        reviewing_open_count=open_task_count('reviewer'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth_app', '0001_initial'),
+        ('kanban_app', '0005_task_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserTaskStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='task_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('assigned_open_count', models.PositiveIntegerField(default=0)),
+                ('reviewing_open_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'User Task Stats',
+                'verbose_name_plural': 'User Task Stats',
+            },
+        ),
+        migrations.RunPython(populate_user_task_stats, migrations.RunPython.noop),
+    ]
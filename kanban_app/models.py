@@ -1,9 +1,55 @@
 from django.db import models
+from django.db.models.functions import Coalesce, Now
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
 
+class BoardQuerySet(models.QuerySet):
+    """
+    QuerySet for boards with access lookups and maintenance helpers for the
+    denormalized task counters.
+    """
+
+    def accessible_ids(self, user):
+        """
+        Return the IDs of the boards the user owns or is a member of.
+
+        Combines two indexed SELECTs with UNION, the membership side read
+        straight from the m2m table, instead of an OR over a LEFT JOIN.
+
+        Returns:
+            QuerySet: Flat UNION queryset of board IDs, usable as a subquery.
+        """
+        owned = self.filter(owner=user).order_by().values_list("id", flat=True)
+        member_of = Board.members.through.objects.filter(user=user).values_list("board_id", flat=True)
+        return owned.union(member_of)
+
+    def update_task_counts(self):
+        """
+        Recompute ticket_count, tasks_to_do_count and tasks_high_prio_count
+        of all boards in this queryset with a single UPDATE.
+
+        Returns:
+            int: Number of updated boards.
+        """
+        def task_count(**filters):
+            tasks = (
+                Task.objects.filter(board=models.OuterRef("pk"), **filters)
+                .order_by()
+                .values("board")
+                .annotate(count=models.Count("id"))
+                .values("count")
+            )
+            return Coalesce(models.Subquery(tasks), 0)
+
+        return self.update(
+            ticket_count=task_count(),
+            tasks_to_do_count=task_count(status="to-do"),
+            tasks_high_prio_count=task_count(priority="high"),
+        )
+
+
 class Board(models.Model):
     """
     Model representing a kanban board.
@@ -12,6 +58,13 @@ class Board(models.Model):
         title (str): The title of the board.
         owner (User): The user who owns the board.
         members (User): Users who have access to this board.
+        ticket_count (int): Number of tasks on the board.
+        tasks_to_do_count (int): Number of tasks with status 'to-do'.
+        tasks_high_prio_count (int): Number of tasks with priority 'high'.
+
+    The task counters are denormalized for cheap board listings; they are kept
+    up to date by the Task signal handlers in kanban_app.signals and can be
+    rebuilt with the recount_boards management command.
     
     Relationships:
         - Each Board can have multiple members (many-to-many).
@@ -22,6 +75,30 @@ class Board(models.Model):
     title = models.CharField(max_length=100)
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="owned_boards")
     members = models.ManyToManyField(User, related_name="boards")
+    ticket_count = models.PositiveIntegerField(default=0, editable=False)
+    tasks_to_do_count = models.PositiveIntegerField(default=0, editable=False)
+    tasks_high_prio_count = models.PositiveIntegerField(default=0, editable=False)
+    objects = BoardQuerySet.as_manager()
+
+    COUNTER_FIELDS = ("ticket_count", "tasks_to_do_count", "tasks_high_prio_count")
+
+    def save(self, *args, **kwargs):
+        """
+        Save the board without writing back the task counters on updates.
+
+        The counters are only written by BoardQuerySet.update_task_counts(),
+        so saving a board loaded before a task change cannot overwrite them
+        with stale values.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
     def __str__(self):
         """String representation showing board title and its ID."""
@@ -33,6 +110,51 @@ class Board(models.Model):
         ordering = ["title", "id"]
 
 
+class TaskQuerySet(models.QuerySet):
+    """
+    QuerySet for tasks with helpers shared by the API views.
+    """
+
+    def with_comments_count(self):
+        """
+        Annotate each task with the number of its comments as comments_count.
+
+        Meta.ordering is not applied to aggregated querysets, so the default
+        ordering is restored unless an explicit one was set.
+        """
+        qs = self.annotate(comments_count=models.Count("comments"))
+        if not self.query.order_by:
+            qs = qs.order_by(*self.model._meta.ordering)
+        return qs
+
+    def with_related(self):
+        """
+        Join the assignee and reviewer, which every task serializer renders.
+        """
+        return self.select_related("assignee", "reviewer")
+
+    def full(self):
+        """
+        Canonical queryset for serialized tasks: assignee and reviewer joined
+        and comments_count annotated, so no field is loaded lazily per task.
+        """
+        return self.with_related().with_comments_count()
+
+
+class TaskCommentQuerySet(models.QuerySet):
+    """
+    QuerySet for task comments with helpers shared by the API views.
+    """
+
+    def with_author(self):
+        """
+        Join the author, loading only the author columns the API renders.
+        """
+        return self.select_related("author").only(
+            "id", "task", "content", "created_at", "author__id", "author__fullname"
+        )
+
+
 class Task(models.Model):
     """
     Model representing a task within a board.
@@ -66,6 +188,9 @@ class Task(models.Model):
         ("medium", "Medium"),
         ("high", "High"),
     ]
+    # Valid choice values, precomputed once for membership checks.
+    STATUS_VALUES = frozenset(key for key, _ in STATUS_CHOICES)
+    PRIORITY_VALUES = frozenset(key for key, _ in PRIORITY_CHOICES)
     board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name="tasks")
     title = models.CharField(max_length=255)
     creator = models.ForeignKey(User, on_delete=models.CASCADE, related_name="created_tasks", null=True, blank=True)
@@ -75,8 +200,23 @@ class Task(models.Model):
     assignee = models.ForeignKey(User, on_delete=models.SET_NULL, related_name="assigned_tasks", null=True, blank=True)
     reviewer = models.ForeignKey(User, on_delete=models.SET_NULL, related_name="reviewing_tasks", null=True, blank=True)
     due_date = models.DateField(null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     updated_at = models.DateTimeField(auto_now=True)
+    objects = TaskQuerySet.as_manager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the board, assignee and reviewer as loaded, so the counters
+        of a previous board and assignee/reviewer can be updated after a change.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_board_id = instance.__dict__.get("board_id")
+        instance._loaded_user_ids = (
+            instance.__dict__.get("assignee_id"),
+            instance.__dict__.get("reviewer_id"),
+        )
+        return instance
 
     def __str__(self):
         """String representation showing task title and current status."""
@@ -86,6 +226,11 @@ class Task(models.Model):
         verbose_name = "Task"
         verbose_name_plural = "Tasks"
         ordering = ["due_date", "priority"]
+        indexes = [
+            models.Index(fields=["board", "status"]),
+            models.Index(fields=["board", "priority"]),
+            models.Index(fields=["board", "due_date", "priority"]),
+        ]
 
 
 class TaskComment(models.Model):
@@ -106,7 +251,8 @@ class TaskComment(models.Model):
     task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='comments')
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='task_comments')
     content = models.TextField()
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
+    objects = TaskCommentQuerySet.as_manager()
 
     def __str__(self):
         """String representation shows author and a preview of content."""
@@ -116,3 +262,62 @@ class TaskComment(models.Model):
         verbose_name = "Task Comment"
         verbose_name_plural = "Task Comments"
         ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["task", "created_at"]),
+        ]
+
+
+class UserTaskStatsQuerySet(models.QuerySet):
+    """
+    QuerySet for user task stats with a helper to rebuild the counters.
+    """
+
+    def update_task_counts(self):
+        """
+        Recompute assigned_open_count and reviewing_open_count of all stats
+        rows in this queryset with a single UPDATE.
+
+        Returns:
+            int: Number of updated rows.
+        """
+        def open_task_count(user_field):
+            tasks = (
+                Task.objects.filter(**{user_field: models.OuterRef("user_id")})
+                .exclude(status="done")
+                .order_by()
+                .values(user_field)
+                .annotate(count=models.Count("id"))
+                .values("count")
+            )
+            return Coalesce(models.Subquery(tasks), 0)
+
+        return self.update(
+            assigned_open_count=open_task_count("assignee"),
+            reviewing_open_count=open_task_count("reviewer"),
+        )
+
+
+class UserTaskStats(models.Model):
+    """
+    Denormalized per-user task counters.
+
+    Attributes:
+        user (User): The user the counters belong to.
+        assigned_open_count (int): Tasks assigned to the user that are not done.
+        reviewing_open_count (int): Tasks reviewed by the user that are not done.
+
+    Kept up to date by the Task signal handlers in kanban_app.signals.
+    """
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="task_stats")
+    assigned_open_count = models.PositiveIntegerField(default=0)
+    reviewing_open_count = models.PositiveIntegerField(default=0)
+    objects = UserTaskStatsQuerySet.as_manager()
+
+    def __str__(self):
+        """String representation showing the user and the open task counters."""
+        return f"{self.user_id}: {self.assigned_open_count} assigned, {self.reviewing_open_count} reviewing"
+
+    class Meta:
+        verbose_name = "User Task Stats"
+        verbose_name_plural = "User Task Stats"
@@ -0,0 +1,64 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from kanban_app.api.cache import bump_data_version
+from kanban_app.models import Board, Task, TaskComment, UserTaskStats
+
+User = get_user_model()
+
+
+@receiver([post_save, post_delete], sender=Task)
+def update_board_task_counts(sender, instance, **kwargs):
+    """
+    Keeps the denormalized task counters of the task's board up to date.
+
+    The counters are recomputed rather than incremented, so status or
+    priority changes of an existing task are reflected without tracking
+    the previous values. The board the task was loaded from is recounted
+    as well, so moving a task updates both boards.
+    """
+    board_id = instance.__dict__.get("board_id")
+    board_ids = {board_id, getattr(instance, "_loaded_board_id", None)} - {None}
+    instance._loaded_board_id = board_id
+    Board.objects.filter(pk__in=board_ids).update_task_counts()
+
+
+@receiver([post_save, post_delete], sender=Task)
+def update_user_task_stats(sender, instance, signal, **kwargs):
+    """
+    Keeps the open task counters of the task's assignee and reviewer up to date.
+
+    Users who were assignee or reviewer before the change are recounted as
+    well, so reassigning a task moves it between their counters.
+
+    Missing stats rows are only created on save. On delete the user may be
+    deleted in the same cascade, so only existing rows are recounted.
+    """
+    # Read the ids from __dict__: a deferred field would be refreshed from a
+    # row that no longer exists after a delete.
+    assignee_id = instance.__dict__.get("assignee_id")
+    reviewer_id = instance.__dict__.get("reviewer_id")
+    user_ids = {assignee_id, reviewer_id, *getattr(instance, "_loaded_user_ids", ())} - {None}
+    instance._loaded_user_ids = (assignee_id, reviewer_id)
+    if not user_ids:
+        return
+    stats = UserTaskStats.objects.filter(user_id__in=user_ids)
+    if stats.update_task_counts() < len(user_ids) and signal is post_save:
+        # Create the missing stats rows on a user's first task, then count again.
+        UserTaskStats.objects.bulk_create(
+            [UserTaskStats(user_id=user_id) for user_id in user_ids], ignore_conflicts=True
+        )
+        stats.update_task_counts()
+
+
+@receiver([post_save, post_delete], sender=Board)
+@receiver([post_save, post_delete], sender=Task)
+@receiver([post_save, post_delete], sender=TaskComment)
+@receiver([post_save, post_delete], sender=User)
+@receiver(m2m_changed, sender=Board.members.through)
+def invalidate_cached_responses(sender, **kwargs):
+    """
+    Invalidates the cached API responses whenever data they render changes.
+    """
+    bump_data_version()
@@ -1,3 +1,130 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from kanban_app.models import Board, Task, UserTaskStats
+
+User = get_user_model()
+
+
+class UserTaskStatsTests(TestCase):
+    """
+    Tests for the UserTaskStats counters kept up to date by kanban_app.signals.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="a@x.de", fullname="A B", password="pw12345!")
+        self.board = Board.objects.create(title="B1", owner=self.user)
+
+    def test_deleting_assignee_cascades_their_tasks(self):
+        """Deleting a user who created and is assigned to a task succeeds."""
+        Task.objects.create(board=self.board, title="T1", creator=self.user, assignee=self.user)
+        self.assertEqual(UserTaskStats.objects.get(user=self.user).assigned_open_count, 1)
+
+        self.user.delete()
+
+        self.assertFalse(User.objects.filter(pk=self.user.pk).exists())
+        self.assertFalse(Task.objects.exists())
+        self.assertFalse(UserTaskStats.objects.exists())
+
+
+class BoardTaskCountTests(TestCase):
+    """
+    Tests for the board task counters kept up to date by kanban_app.signals.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="a@x.de", fullname="A B", password="pw12345!")
+        self.board = Board.objects.create(title="B1", owner=self.user)
+        self.other_board = Board.objects.create(title="B2", owner=self.user)
+
+    def counts(self, board):
+        board.refresh_from_db()
+        return board.ticket_count, board.tasks_to_do_count, board.tasks_high_prio_count
+
+    def test_moving_task_recounts_both_boards(self):
+        """Moving a task to another board updates the counters of both boards."""
+        Task.objects.create(board=self.board, title="T1", status="to-do", priority="high")
+        task = Task.objects.get()
+
+        task.board = self.other_board
+        task.save()
+
+        self.assertEqual(self.counts(self.board), (0, 0, 0))
+        self.assertEqual(self.counts(self.other_board), (1, 1, 1))
+
+    def test_saving_stale_board_keeps_counters(self):
+        """Saving a board loaded before a task was created keeps the new counts."""
+        Task.objects.create(board=self.board, title="T1")
+        stale = Board.objects.get(pk=self.board.pk)
+        Task.objects.create(board=self.board, title="T2")
+
+        stale.title = "Renamed"
+        stale.save()
+
+        self.assertEqual(self.counts(self.board), (2, 2, 0))
+
+
+class TaskAdminTests(TestCase):
+    """
+    Tests for the Task admin changelist.
+    """
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(email="admin@x.de", fullname="Ad Min", password="pw12345!")
+        self.board = Board.objects.create(title="B1", owner=self.admin)
+        self.client.force_login(self.admin)
+
+    def test_delete_selected_tasks(self):
+        """The 'Delete selected tasks' action deletes tasks and updates the counters."""
+        task = Task.objects.create(board=self.board, title="T1", assignee=self.admin, reviewer=self.admin)
+
+        response = self.client.post(
+            "/admin/kanban_app/task/",
+            {"action": "delete_selected", "_selected_action": [task.pk], "post": "yes"},
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Task.objects.exists())
+        stats = UserTaskStats.objects.get(user=self.admin)
+        self.assertEqual((stats.assigned_open_count, stats.reviewing_open_count), (0, 0))
+
+
+class TaskSerializerTests(TestCase):
+    """
+    Tests for the validation of task update payloads.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="a@x.de", fullname="A B", password="pw12345!")
+        self.board = Board.objects.create(title="B1", owner=self.user)
+        self.task = Task.objects.create(board=self.board, title="T1", creator=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_update_with_non_dict_body_is_rejected(self):
+        """A JSON body that is not an object returns 400 instead of a server error."""
+        response = self.client.put(f"/api/tasks/{self.task.pk}/", 5, format="json")
+
+        self.assertEqual(response.status_code, 400)
+
+
+class CachedResponseTests(TestCase):
+    """
+    Tests for the cached list responses without a shared cache backend.
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(email="a@x.de", fullname="A B", password="pw12345!")
+        Board.objects.create(title="B1", owner=self.user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_conditional_get_without_shared_cache(self):
+        """The ETag of an uncached list response still answers If-None-Match with 304."""
+        response = self.client.get("/api/boards/")
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get("/api/boards/", HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, 304)